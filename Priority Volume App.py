@@ -1,10 +1,21 @@
 import sys
 import os
 import json
+import math
 import ctypes
+from collections import OrderedDict
 from ctypes import wintypes
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QSlider, QHBoxLayout, QScrollArea, QPushButton, QFrame, QSizePolicy, QSpinBox, QStyle
-from PyQt5.QtCore import Qt, QTimer, QRect, QSize
+
+from single_instance import InstanceLock, answer_instance_request, notify_running_instance
+
+# Checked before the Qt/pycaw imports so a second launch exits right away.
+if __name__ == "__main__":
+    instance_lock = InstanceLock()
+    if not instance_lock.acquire():
+        sys.exit(0 if notify_running_instance(instance_lock.path) else 1)
+
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QSlider, QHBoxLayout, QScrollArea, QPushButton, QFrame, QSizePolicy, QSpinBox, QStyle, QComboBox, QInputDialog
+from PyQt5.QtCore import Qt, QTimer, QRect, QSize, QSocketNotifier
 from PyQt5.QtGui import QPixmap, QIcon, QPainter, QColor, QBrush, QPen
 from pycaw.pycaw import AudioUtilities, ISimpleAudioVolume
 
@@ -24,6 +35,15 @@ try:
 except Exception:
     winreg = None
 
+ICON_SIZE = 40
+ICON_CACHE_LIMIT = 64
+
+LEVEL_ALPHA = 0.02
+LEVEL_SILENCE = 0.01
+LEVEL_MIN_SAMPLES = 20
+LEVEL_MIN_VOLUME = 0.05
+LEVEL_MAX_STEP = 0.02
+
 
 class SHFILEINFO(ctypes.Structure):
     _fields_ = [
@@ -35,6 +55,37 @@ class SHFILEINFO(ctypes.Structure):
     ]
 
 
+class LoudnessTracker:
+    def __init__(self):
+        self.stats = {}
+
+    def update(self, samples):
+        # Session meters read after the app's own volume is applied, so divide it
+        # back out to get the source loudness. Each session keeps a running mean
+        # of squared peaks and a sample count, nothing else.
+        for pid, peak, vol in samples:
+            if vol < LEVEL_MIN_VOLUME:
+                continue
+            source = min(1.0, peak / vol)
+            if source < LEVEL_SILENCE:
+                continue
+            st = self.stats.get(pid)
+            if st is None:
+                self.stats[pid] = [source * source, 1]
+            else:
+                st[0] += LEVEL_ALPHA * (source * source - st[0])
+                st[1] += 1
+
+    def level(self, pid):
+        st = self.stats.get(pid)
+        if st is None or st[1] < LEVEL_MIN_SAMPLES:
+            return None
+        return math.sqrt(st[0])
+
+    def remove(self, pid):
+        self.stats.pop(pid, None)
+
+
 class VolumeMeter(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -78,13 +129,19 @@ class VolumeMeter(QWidget):
 
 
 class AppRow(QFrame):
+    live_rows = 0
+
     def __init__(self, pid, name, vol_iface, icon_pixmap, meter_iface, controller):
         super().__init__()
+        AppRow.live_rows += 1
+        self.destroyed.connect(AppRow.on_row_destroyed)
         self.pid = pid
         self.name = name
         self.vol_iface = vol_iface
         self.meter_iface = meter_iface
         self.controller = controller
+        self.manual_volume = False
+        self.last_leveled_volume = None
         self.setFixedHeight(56)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setFrameShape(QFrame.NoFrame)
@@ -96,9 +153,9 @@ class AppRow(QFrame):
         self.meter = VolumeMeter()
 
         self.icon_label = QLabel()
-        self.icon_label.setFixedSize(40, 40)
+        self.icon_label.setFixedSize(ICON_SIZE, ICON_SIZE)
         if icon_pixmap is not None:
-            self.icon_label.setPixmap(icon_pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.icon_label.setPixmap(icon_pixmap)
 
         self.name_label = QLabel(f"{self.name}")
         self.name_label.setMinimumWidth(140)
@@ -153,6 +210,29 @@ class AppRow(QFrame):
         self.mute_button.toggled.connect(self.on_mute_toggled)
         self.set_normal_style()
 
+    @staticmethod
+    def on_row_destroyed(*args):
+        AppRow.live_rows -= 1
+
+    def release(self):
+        try:
+            self.slider.valueChanged.disconnect(self.on_slider_changed)
+        except Exception:
+            pass
+        try:
+            self.mute_button.toggled.disconnect(self.on_mute_toggled)
+        except Exception:
+            pass
+        for label in (self.name_label, self.icon_label):
+            try:
+                del label.mousePressEvent
+            except Exception:
+                pass
+        self.icon_label.clear()
+        self.vol_iface = None
+        self.meter_iface = None
+        self.controller = None
+
     def set_normal_style(self):
         self.setStyleSheet("QFrame{background-color:transparent;border-bottom:1px solid #e6e6e6;margin:0;padding:6px 8px;} QLabel{font-size:12px;}")
 
@@ -179,9 +259,13 @@ class AppRow(QFrame):
         self.mute_button.blockSignals(blocked)
 
     def on_click(self, ev):
-        self.controller.set_priority_by_pid(self.pid)
+        if self.controller is not None:
+            self.controller.set_priority_by_pid(self.pid)
 
     def mousePressEvent(self, event):
+        if self.controller is None:
+            super().mousePressEvent(event)
+            return
         try:
             pos = event.pos()
             if self.slider.geometry().contains(pos) or self.mute_button.geometry().contains(pos):
@@ -198,6 +282,9 @@ class AppRow(QFrame):
             self.vol_iface.SetMasterVolume(val / 100.0, None)
         except Exception:
             pass
+        self.manual_volume = True
+        if self.controller is None:
+            return
         if self.controller.priority_pid == self.pid:
             self.controller.priority_locked_to_target = False
 
@@ -216,18 +303,19 @@ class AppRow(QFrame):
 
     def update_meter_from_peak(self):
         if self.meter_iface is None or not METER_SUPPORTED:
-            return
+            return None
         try:
             peak = float(self.meter_iface.GetPeakValue())
             self.meter.set_level(peak)
+            return peak
         except Exception:
-            pass
+            return None
 
 
 class VolumeController(QMainWindow):
-    def __init__(self):
+    def __init__(self, settings_path=None):
         super().__init__()
-        self.settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
+        self.settings_path = settings_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
         self.load_settings()
         self.setWindowTitle("Per-App Priority Volume")
         self.resize(900, 640)
@@ -260,6 +348,13 @@ class VolumeController(QMainWindow):
         self.btn_auto_100.setChecked(self.settings.get("auto_100_enabled", False))
         self.btn_auto_100.setStyleSheet(self.auto_style(self.btn_auto_100.isChecked()))
 
+        self.btn_auto_level = QPushButton("Auto Level Volume")
+        self.btn_auto_level.setCheckable(True)
+        self.btn_auto_level.setChecked(self.settings.get("auto_level_enabled", False))
+        self.btn_auto_level.setStyleSheet(self.auto_style(self.btn_auto_level.isChecked()))
+        if not METER_SUPPORTED:
+            self.btn_auto_level.setEnabled(False)
+
         self.btn_startup = QPushButton("Start with Windows")
         self.btn_startup.setCheckable(True)
         startup_state = self.get_startup_enabled()
@@ -274,10 +369,32 @@ class VolumeController(QMainWindow):
         self.top_layout.addWidget(self.btn_all_0)
         self.top_layout.addWidget(self.btn_auto_priority)
         self.top_layout.addWidget(self.btn_auto_100)
+        self.top_layout.addWidget(self.btn_auto_level)
         self.top_layout.addWidget(self.btn_startup)
         self.top_layout.addStretch()
         self.main_layout.addWidget(self.top_bar)
 
+        self.scene_bar = QWidget()
+        self.scene_layout = QHBoxLayout()
+        self.scene_layout.setContentsMargins(0, 0, 0, 0)
+        self.scene_layout.setSpacing(8)
+        self.scene_bar.setLayout(self.scene_layout)
+
+        scene_label = QLabel("Scene")
+        self.scene_combo = QComboBox()
+        self.scene_combo.setMinimumWidth(160)
+        self.btn_scene_apply = QPushButton("Apply Scene")
+        self.btn_scene_save = QPushButton("Save Scene")
+        self.btn_scene_delete = QPushButton("Delete Scene")
+
+        self.scene_layout.addWidget(scene_label)
+        self.scene_layout.addWidget(self.scene_combo)
+        self.scene_layout.addWidget(self.btn_scene_apply)
+        self.scene_layout.addWidget(self.btn_scene_save)
+        self.scene_layout.addWidget(self.btn_scene_delete)
+        self.scene_layout.addStretch()
+        self.main_layout.addWidget(self.scene_bar)
+
         info_row = QWidget()
         info_layout = QHBoxLayout()
         info_layout.setContentsMargins(2, 0, 2, 0)
@@ -307,8 +424,15 @@ class VolumeController(QMainWindow):
 
         spin_layout.addWidget(pri_label)
         spin_layout.addWidget(self.spin_priority)
+        level_label = QLabel("Level target (%)")
+        self.spin_level = QSpinBox()
+        self.spin_level.setRange(1, 100)
+        self.spin_level.setValue(self.settings.get("auto_level_target", 20))
+
         spin_layout.addWidget(other_label)
         spin_layout.addWidget(self.spin_other)
+        spin_layout.addWidget(level_label)
+        spin_layout.addWidget(self.spin_level)
         info_layout.addWidget(spin_container, 2)
 
         self.main_layout.addWidget(info_row)
@@ -327,18 +451,27 @@ class VolumeController(QMainWindow):
 
         self.sessions = {}
         self.rows = {}
-        self.icons_cache = {}
+        self.icons_cache = OrderedDict()
         self.priority_pid = None
         self.priority_locked_to_target = True
+        self.active_scene = None
         self.priority_percent = int(self.spin_priority.value())
         self.background_percent = int(self.spin_other.value())
+        self.level_target_percent = int(self.spin_level.value())
+        self.loudness = LoudnessTracker()
 
         self.btn_all_100.clicked.connect(self.set_all_100)
         self.btn_all_0.clicked.connect(self.set_all_0)
         self.btn_auto_priority.toggled.connect(self.on_auto_toggled)
         self.btn_auto_100.toggled.connect(self.on_auto_100_toggled)
+        self.btn_auto_level.toggled.connect(self.on_auto_level_toggled)
         self.spin_priority.valueChanged.connect(self.on_priority_spin_changed)
         self.spin_other.valueChanged.connect(self.on_other_spin_changed)
+        self.spin_level.valueChanged.connect(self.on_level_spin_changed)
+        self.btn_scene_apply.clicked.connect(self.on_scene_apply)
+        self.btn_scene_save.clicked.connect(self.on_scene_save)
+        self.btn_scene_delete.clicked.connect(self.on_scene_delete)
+        self.refresh_scene_combo()
 
         self.refresh_sessions()
 
@@ -360,6 +493,9 @@ class VolumeController(QMainWindow):
             "auto_priority_enabled": False,
             "auto_100_enabled": False,
             "run_at_startup": False,
+            "auto_level_enabled": False,
+            "auto_level_target": 20,
+            "scenes": {},
         }
         try:
             if os.path.exists(self.settings_path):
@@ -377,6 +513,8 @@ class VolumeController(QMainWindow):
             self.settings["auto_priority_enabled"] = bool(self.btn_auto_priority.isChecked()) if hasattr(self, "btn_auto_priority") else self.settings.get("auto_priority_enabled", False)
             self.settings["auto_100_enabled"] = bool(self.btn_auto_100.isChecked()) if hasattr(self, "btn_auto_100") else self.settings.get("auto_100_enabled", False)
             self.settings["run_at_startup"] = bool(self.btn_startup.isChecked()) if hasattr(self, "btn_startup") else self.settings.get("run_at_startup", False)
+            self.settings["auto_level_enabled"] = bool(self.btn_auto_level.isChecked()) if hasattr(self, "btn_auto_level") else self.settings.get("auto_level_enabled", False)
+            self.settings["auto_level_target"] = int(self.level_target_percent) if hasattr(self, "level_target_percent") else self.settings.get("auto_level_target", 20)
             with open(self.settings_path, "w", encoding="utf-8") as f:
                 json.dump(self.settings, f, indent=2)
         except Exception:
@@ -400,12 +538,26 @@ class VolumeController(QMainWindow):
         self.btn_auto_100.setStyleSheet(self.auto_style(checked))
         self.save_settings()
 
+    def on_auto_level_toggled(self, checked):
+        self.btn_auto_level.setStyleSheet(self.auto_style(checked))
+        self.save_settings()
+        if checked:
+            self.active_scene = None
+            for row in self.rows.values():
+                row.manual_volume = False
+
+    def on_level_spin_changed(self, val):
+        self.level_target_percent = int(val)
+        self.save_settings()
+
     def on_priority_spin_changed(self, val):
+        self.active_scene = None
         self.priority_percent = int(val)
         self.save_settings()
         self.enforce_priority()
 
     def on_other_spin_changed(self, val):
+        self.active_scene = None
         self.background_percent = int(val)
         self.save_settings()
         self.enforce_priority()
@@ -416,13 +568,91 @@ class VolumeController(QMainWindow):
             fg = self.get_foreground_pid()
             if fg and fg in self.sessions and fg != self.priority_pid:
                 self.set_priority_by_pid(fg)
+        self.auto_level()
+
+    def attach_instance_server(self, srv):
+        self.instance_server = srv
+        self.instance_notifier = QSocketNotifier(srv.fileno(), QSocketNotifier.Read, self)
+        self.instance_notifier.activated.connect(self.on_instance_message)
+
+    def on_instance_message(self, *args):
+        while True:
+            try:
+                conn, _ = self.instance_server.accept()
+            except OSError:
+                break
+            if answer_instance_request(conn):
+                self.bring_to_front()
+
+    def bring_to_front(self):
+        if self.isMinimized():
+            self.showNormal()
+        else:
+            self.show()
+        self.raise_()
+        self.activateWindow()
 
     def update_meters(self):
+        leveling = self.btn_auto_level.isChecked()
+        samples = []
         for pid, info in list(self.sessions.items()):
             try:
                 row = self.rows.get(pid)
                 if row:
-                    row.update_meter_from_peak()
+                    peak = row.update_meter_from_peak()
+                    if leveling and peak is not None and not row.mute_button.isChecked():
+                        samples.append((pid, peak, row.slider.value() / 100.0))
+            except Exception:
+                pass
+        if samples:
+            self.loudness.update(samples)
+
+    def leveled_volume(self, pid, cap):
+        # The louder an app is above the target, the further it sits below the
+        # cap. Callers that would write the cap use this instead, so a loud app
+        # never jumps back up to the full background volume.
+        if not self.btn_auto_level.isChecked():
+            return cap
+        level = self.loudness.level(pid)
+        if level is None:
+            return cap
+        target = max(0.0, min(1.0, self.level_target_percent / 100.0))
+        return max(min(LEVEL_MIN_VOLUME, cap), min(cap, cap * target / level))
+
+    def auto_level(self):
+        # Moves non-priority sessions a small step per poll toward their
+        # levelled volume. Without a priority app there is no background cap
+        # to level under, so volumes are left alone.
+        if not self.btn_auto_level.isChecked() or self.active_scene is not None:
+            return
+        if self.priority_pid is None:
+            return
+        cap = max(0.0, min(1.0, self.background_percent / 100.0))
+        for pid, info in self.sessions.items():
+            if pid == self.priority_pid:
+                continue
+            row = self.rows.get(pid)
+            if row is None or row.manual_volume:
+                continue
+            if self.loudness.level(pid) is None:
+                continue
+            try:
+                cur = float(info.get("vol").GetMasterVolume())
+            except Exception:
+                continue
+            # Anything else that moved the volume since we last set it (the
+            # Windows mixer, the app itself) counts as a manual override.
+            if row.last_leveled_volume is not None and abs(cur - row.last_leveled_volume) > 0.005:
+                row.manual_volume = True
+                continue
+            desired = self.leveled_volume(pid, cap)
+            if abs(desired - cur) < 0.01:
+                continue
+            new = cur + max(-LEVEL_MAX_STEP, min(LEVEL_MAX_STEP, desired - cur))
+            try:
+                info.get("vol").SetMasterVolume(new, None)
+                row.last_leveled_volume = new
+                row.update_volume_display(new)
             except Exception:
                 pass
 
@@ -445,6 +675,7 @@ class VolumeController(QMainWindow):
             except Exception:
                 pexe = None
             if pexe and pexe in self.icons_cache:
+                self.icons_cache.move_to_end(pexe)
                 return self.icons_cache[pexe]
             if pexe:
                 try:
@@ -456,8 +687,9 @@ class VolumeController(QMainWindow):
                         hicon = shfi.hIcon
                         pix = QPixmap.fromWinHICON(int(hicon))
                         ctypes.windll.user32.DestroyIcon(hicon)
-                        self.icons_cache[pexe] = pix
-                        return pix
+                        pix = self.cache_icon(pexe, pix)
+                        if pix is not None:
+                            return pix
                 except Exception:
                     pass
                 try:
@@ -468,15 +700,35 @@ class VolumeController(QMainWindow):
                         hicon = large[0]
                         pix = QPixmap.fromWinHICON(int(hicon))
                         ctypes.windll.user32.DestroyIcon(hicon)
-                        self.icons_cache[pexe] = pix
-                        return pix
+                        return self.cache_icon(pexe, pix)
                 except Exception:
                     pass
         except Exception:
             pass
         return None
 
+    def cache_icon(self, pexe, pix):
+        # Only the row-sized copy is kept, and the least recently used exes are
+        # dropped once the cache is full.
+        if pix.isNull():
+            return None
+        pix = pix.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.icons_cache[pexe] = pix
+        self.icons_cache.move_to_end(pexe)
+        while len(self.icons_cache) > ICON_CACHE_LIMIT:
+            self.icons_cache.popitem(last=False)
+        return pix
+
+    def live_object_counts(self):
+        return {
+            "sessions": len(self.sessions),
+            "rows": len(self.rows),
+            "row_widgets": AppRow.live_rows,
+            "icons": len(self.icons_cache),
+        }
+
     def refresh_sessions(self):
+        seen = set()
         current = {}
         sessions = AudioUtilities.GetAllSessions()
         for s in sessions:
@@ -484,6 +736,18 @@ class VolumeController(QMainWindow):
             if proc is None:
                 continue
             pid = proc.pid
+            if pid in seen:
+                continue
+            # A process can close its stream and open a new one, so a known pid
+            # is only reused while its session instance is the same.
+            try:
+                instance = s.InstanceIdentifier
+            except Exception:
+                instance = None
+            known = self.sessions.get(pid)
+            if known is not None and known.get("instance") == instance:
+                seen.add(pid)
+                continue
             try:
                 name = proc.name()
             except Exception:
@@ -498,33 +762,36 @@ class VolumeController(QMainWindow):
                     meter_iface = s._ctl.QueryInterface(IAudioMeterInformation)
                 except Exception:
                     meter_iface = None
-            current[pid] = (name, vol_iface, proc, meter_iface)
+            seen.add(pid)
+            current[pid] = (name, vol_iface, proc, meter_iface, instance)
 
-        removed = set(self.sessions.keys()) - set(current.keys())
+        removed = set(self.sessions.keys()) - seen
         for pid in removed:
+            self.release_session(pid)
             self.remove_row(pid)
-            try:
-                del self.sessions[pid]
-            except Exception:
-                pass
 
-        added = set(current.keys()) - set(self.sessions.keys())
-        for pid in added:
-            name, vol_iface, proc, meter_iface = current[pid]
-            self.sessions[pid] = {"vol": vol_iface, "proc": proc, "meter": meter_iface}
+        for pid in current.keys():
+            name, vol_iface, proc, meter_iface, instance = current[pid]
+            if pid in self.sessions:
+                self.rebind_session(pid, vol_iface, proc, meter_iface, instance)
+                continue
+            self.sessions[pid] = {"vol": vol_iface, "proc": proc, "meter": meter_iface, "instance": instance}
             icon = self.get_icon_for_pid(pid, proc)
-            self.add_row(pid, name, vol_iface, icon, meter_iface)
+            scene_applied = self.add_row(pid, name, vol_iface, icon, meter_iface)
             try:
-                if hasattr(self, "btn_auto_100") and self.btn_auto_100.isChecked():
+                if not scene_applied and hasattr(self, "btn_auto_100") and self.btn_auto_100.isChecked():
                     vol_iface.SetMasterVolume(1.0, None)
                     if pid in self.rows:
                         self.rows[pid].update_volume_display(1.0)
             except Exception:
                 pass
 
-        for pid in current.keys():
+        for pid in seen:
             try:
-                vol_iface = current[pid][1]
+                info = self.sessions.get(pid)
+                if info is None:
+                    continue
+                vol_iface = info["vol"]
                 cur = vol_iface.GetMasterVolume()
                 muted = False
                 try:
@@ -541,20 +808,26 @@ class VolumeController(QMainWindow):
         row = AppRow(pid, name, vol_iface, icon_pixmap, meter_iface, self)
         self.list_layout.addWidget(row)
         self.rows[pid] = row
+        if self.active_scene is not None and self.apply_scene_to_new_pid(pid):
+            return True
         if self.priority_pid is not None and pid != self.priority_pid:
             try:
-                vol_iface.SetMasterVolume(max(0.0, min(1.0, self.background_percent / 100.0)), None)
-                row.update_volume_display(max(0.0, min(1.0, self.background_percent / 100.0)))
+                bg_val = self.leveled_volume(pid, max(0.0, min(1.0, self.background_percent / 100.0)))
+                vol_iface.SetMasterVolume(bg_val, None)
+                row.last_leveled_volume = bg_val
+                row.update_volume_display(bg_val)
                 row.set_normal_style()
             except Exception:
                 pass
         elif self.priority_pid == pid:
             row.set_selected_style()
+        return False
 
     def remove_row(self, pid):
         if pid in self.rows:
             row = self.rows[pid]
             self.list_layout.removeWidget(row)
+            row.release()
             row.deleteLater()
             del self.rows[pid]
             if self.priority_pid == pid:
@@ -562,9 +835,29 @@ class VolumeController(QMainWindow):
                 self.priority_locked_to_target = True
                 self.enforce_priority()
 
+    def release_session(self, pid):
+        # Dropping the last references releases the COM interfaces and the
+        # psutil process object right away instead of whenever gc gets to them.
+        self.loudness.remove(pid)
+        info = self.sessions.pop(pid, None)
+        if info is not None:
+            info.clear()
+
+    def rebind_session(self, pid, vol_iface, proc, meter_iface, instance):
+        self.loudness.remove(pid)
+        info = self.sessions[pid]
+        info.clear()
+        info.update({"vol": vol_iface, "proc": proc, "meter": meter_iface, "instance": instance})
+        row = self.rows.get(pid)
+        if row is not None:
+            row.vol_iface = vol_iface
+            row.meter_iface = meter_iface
+            row.last_leveled_volume = None
+
     def set_priority_by_pid(self, pid):
         if pid not in self.sessions:
             return
+        self.active_scene = None
         self.priority_pid = pid
         self.priority_locked_to_target = True
         self.enforce_priority()
@@ -590,14 +883,18 @@ class VolumeController(QMainWindow):
                             vol_iface.SetMasterVolume(current, None)
                             self.rows[pid].update_volume_display(current)
                 else:
-                    vol_iface.SetMasterVolume(bg_val, None)
+                    vol = self.leveled_volume(pid, bg_val)
+                    vol_iface.SetMasterVolume(vol, None)
                     if pid in self.rows:
-                        self.rows[pid].update_volume_display(bg_val)
+                        self.rows[pid].manual_volume = False
+                        self.rows[pid].last_leveled_volume = vol
+                        self.rows[pid].update_volume_display(vol)
                         self.rows[pid].set_normal_style()
             except Exception:
                 pass
 
     def set_all_100(self):
+        self.active_scene = None
         self.priority_pid = None
         self.priority_locked_to_target = True
         for pid, info in self.sessions.items():
@@ -605,12 +902,14 @@ class VolumeController(QMainWindow):
                 vol_iface = info.get("vol")
                 vol_iface.SetMasterVolume(1.0, None)
                 if pid in self.rows:
+                    self.rows[pid].manual_volume = True
                     self.rows[pid].update_volume_display(1.0)
                     self.rows[pid].set_normal_style()
             except Exception:
                 pass
 
     def set_all_0(self):
+        self.active_scene = None
         self.priority_pid = None
         self.priority_locked_to_target = True
         for pid, info in self.sessions.items():
@@ -618,11 +917,155 @@ class VolumeController(QMainWindow):
                 vol_iface = info.get("vol")
                 vol_iface.SetMasterVolume(0.0, None)
                 if pid in self.rows:
+                    self.rows[pid].manual_volume = True
                     self.rows[pid].update_volume_display(0.0)
                     self.rows[pid].set_normal_style()
             except Exception:
                 pass
 
+    def refresh_scene_combo(self, select=None):
+        current = select if select is not None else self.scene_combo.currentText()
+        names = sorted(self.settings.get("scenes", {}).keys())
+        blocked = self.scene_combo.blockSignals(True)
+        self.scene_combo.clear()
+        self.scene_combo.addItems(names)
+        if current in names:
+            self.scene_combo.setCurrentIndex(names.index(current))
+        self.scene_combo.blockSignals(blocked)
+        has_scenes = bool(names)
+        self.btn_scene_apply.setEnabled(has_scenes)
+        self.btn_scene_delete.setEnabled(has_scenes)
+
+    def on_scene_save(self):
+        name, ok = QInputDialog.getText(self, "Save Scene", "Scene name:", text=self.scene_combo.currentText())
+        name = name.strip() if ok else ""
+        if not name:
+            return
+        self.settings.setdefault("scenes", {})[name] = self.capture_scene()
+        self.save_settings()
+        self.refresh_scene_combo(select=name)
+
+    def on_scene_delete(self):
+        name = self.scene_combo.currentText()
+        scenes = self.settings.get("scenes", {})
+        if name not in scenes:
+            return
+        del scenes[name]
+        if self.active_scene == name:
+            self.active_scene = None
+        self.save_settings()
+        self.refresh_scene_combo()
+
+    def on_scene_apply(self):
+        name = self.scene_combo.currentText()
+        if name:
+            self.apply_scene(name)
+
+    def capture_scene(self):
+        # Each exe maps to one entry per session, in the order the sessions
+        # appeared, so apps with several streams keep their separate levels.
+        scene = {}
+        for pid, info in self.sessions.items():
+            row = self.rows.get(pid)
+            if row is None:
+                continue
+            vol_iface = info.get("vol")
+            try:
+                vol = int(round(vol_iface.GetMasterVolume() * 100))
+            except Exception:
+                vol = row.slider.value()
+            try:
+                muted = bool(vol_iface.GetMute())
+            except Exception:
+                muted = row.mute_button.isChecked()
+            scene.setdefault(row.name, []).append({"volume": vol, "muted": muted, "priority": pid == self.priority_pid})
+        return scene
+
+    def scene_entry(self, scene, name, index):
+        entries = scene.get(name)
+        if not entries:
+            return None
+        return entries[min(index, len(entries) - 1)]
+
+    def apply_scene_entry(self, pid, entry):
+        # Diff against the live session state, not the rows, which can be up
+        # to a poll behind, and only write what actually differs.
+        row = self.rows.get(pid)
+        info = self.sessions.get(pid)
+        if row is None or info is None:
+            return
+        vol_iface = info.get("vol")
+        try:
+            try:
+                cur = int(round(vol_iface.GetMasterVolume() * 100))
+            except Exception:
+                cur = row.slider.value()
+            vol = max(0, min(100, int(entry.get("volume", cur))))
+            if cur != vol:
+                vol_iface.SetMasterVolume(vol / 100.0, None)
+                row.last_leveled_volume = None
+            if row.slider.value() != vol:
+                row.update_volume_display(vol / 100.0)
+        except Exception:
+            pass
+        try:
+            try:
+                cur_muted = bool(vol_iface.GetMute())
+            except Exception:
+                cur_muted = row.mute_button.isChecked()
+            muted = bool(entry.get("muted", cur_muted))
+            if cur_muted != muted:
+                vol_iface.SetMute(muted, None)
+            if row.mute_button.isChecked() != muted:
+                row.update_mute_display(muted)
+        except Exception:
+            pass
+
+    def apply_scene(self, name):
+        scene = self.settings.get("scenes", {}).get(name)
+        if scene is None:
+            return
+        self.active_scene = name
+        old_priority = self.priority_pid
+        new_priority = None
+        seen_names = {}
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            for pid, row in list(self.rows.items()):
+                index = seen_names.get(row.name, 0)
+                seen_names[row.name] = index + 1
+                entry = self.scene_entry(scene, row.name, index)
+                if entry is None or pid not in self.sessions:
+                    continue
+                self.apply_scene_entry(pid, entry)
+                if entry.get("priority") and new_priority is None:
+                    new_priority = pid
+            self.priority_pid = new_priority
+            self.priority_locked_to_target = new_priority is None
+            if old_priority != new_priority:
+                if old_priority in self.rows:
+                    self.rows[old_priority].set_normal_style()
+                if new_priority in self.rows:
+                    self.rows[new_priority].set_selected_style()
+        finally:
+            self.list_container.setUpdatesEnabled(True)
+
+    def apply_scene_to_new_pid(self, pid):
+        scene = self.settings.get("scenes", {}).get(self.active_scene)
+        row = self.rows.get(pid)
+        if scene is None or row is None:
+            return False
+        index = sum(1 for other, other_row in self.rows.items() if other != pid and other_row.name == row.name)
+        entry = self.scene_entry(scene, row.name, index)
+        if entry is None:
+            return False
+        self.apply_scene_entry(pid, entry)
+        if entry.get("priority") and self.priority_pid is None:
+            self.priority_pid = pid
+            self.priority_locked_to_target = False
+            row.set_selected_style()
+        return True
+
     def _expected_run_command(self):
         if getattr(sys, "frozen", False):
             return f'"{sys.executable}"'
@@ -736,5 +1179,7 @@ if __name__ == "__main__":
     except Exception:
         pass
     win = VolumeController()
+    if instance_lock.server is not None:
+        win.attach_instance_server(instance_lock.server)
     win.show()
     sys.exit(app.exec_())
\ No newline at end of file
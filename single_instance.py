@@ -0,0 +1,149 @@
+import os
+import time
+import socket
+import ctypes
+import getpass
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+INSTANCE_NAME = "PerAppPriorityVolume"
+INSTANCE_HOST = "127.0.0.1"
+INSTANCE_REQUEST = b"PerAppPriorityVolume:show\n"
+INSTANCE_REPLY = b"PerAppPriorityVolume:shown\n"
+INSTANCE_WAIT = 2.0
+ERROR_ALREADY_EXISTS = 183
+
+LOCK_ACQUIRED = "acquired"
+LOCK_HELD = "held"
+LOCK_UNAVAILABLE = "unavailable"
+
+
+def instance_user():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ""
+    return "".join(c for c in user if c.isalnum() or c in "-_") or "user"
+
+
+def instance_lock_path():
+    return os.path.join(tempfile.gettempdir(), f"{INSTANCE_NAME}-{instance_user()}.lock")
+
+
+class InstanceLock:
+    def __init__(self, path=None):
+        self.path = path or instance_lock_path()
+        self.handle = None
+        self.server = None
+
+    def acquire(self):
+        # Returns False only when another instance really holds the lock. If
+        # the lock can't be set up at all, the app still starts, just without
+        # single-instance protection.
+        if os.name == "nt":
+            state = self._acquire_mutex()
+        else:
+            state = self._acquire_file_lock()
+        if state == LOCK_HELD:
+            return False
+        if state == LOCK_ACQUIRED:
+            self._open_server()
+        return True
+
+    def _acquire_mutex(self):
+        try:
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            kernel32.CreateMutexW.restype = ctypes.c_void_p
+            name = "Local\\" + os.path.basename(self.path)
+            handle = kernel32.CreateMutexW(None, False, name)
+            if not handle:
+                return LOCK_UNAVAILABLE
+            if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+                kernel32.CloseHandle(ctypes.c_void_p(handle))
+                return LOCK_HELD
+            self.handle = handle
+            return LOCK_ACQUIRED
+        except Exception:
+            return LOCK_UNAVAILABLE
+
+    def _acquire_file_lock(self):
+        if fcntl is None:
+            return LOCK_UNAVAILABLE
+        try:
+            f = open(self.path, "a+")
+        except OSError:
+            return LOCK_UNAVAILABLE
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return LOCK_HELD
+        except OSError:
+            f.close()
+            return LOCK_UNAVAILABLE
+        self.handle = f
+        return LOCK_ACQUIRED
+
+    def _open_server(self):
+        # The port is ephemeral and published next to the lock, so the lock
+        # itself never depends on a port being free.
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            srv.bind((INSTANCE_HOST, 0))
+            srv.listen(4)
+            srv.setblocking(False)
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(str(srv.getsockname()[1]))
+            self.server = srv
+        except OSError:
+            srv.close()
+
+
+def answer_instance_request(conn, timeout=0.05):
+    try:
+        conn.settimeout(timeout)
+        msg = conn.recv(64)
+        if msg != INSTANCE_REQUEST:
+            return False
+        conn.sendall(INSTANCE_REPLY)
+        return True
+    except OSError:
+        return False
+    finally:
+        conn.close()
+
+
+def notify_running_instance(path=None, wait=INSTANCE_WAIT):
+    # Only a listener that answers with our reply counts as the running app.
+    # The lock holder may still be starting up, so keep retrying until the
+    # deadline.
+    path = path or instance_lock_path()
+    try:
+        ctypes.windll.user32.AllowSetForegroundWindow(-1)
+    except Exception:
+        pass
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                port = int(f.read().strip())
+            remaining = max(0.05, deadline - time.monotonic())
+            with socket.create_connection((INSTANCE_HOST, port), timeout=remaining) as conn:
+                conn.sendall(INSTANCE_REQUEST)
+                reply = b""
+                while not reply.endswith(b"\n") and len(reply) < 64:
+                    chunk = conn.recv(64)
+                    if not chunk:
+                        break
+                    reply += chunk
+            if reply == INSTANCE_REPLY:
+                return True
+        except (OSError, ValueError):
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS)
+for path in (ROOT, TESTS):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    import fakes  # noqa: F401  (sets the offscreen platform before Qt starts)
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    from fakes import FakeBackend, app
+    fake = FakeBackend()
+    monkeypatch.setattr(app.AudioUtilities, "GetAllSessions", fake.GetAllSessions)
+    return fake
+
+
+@pytest.fixture
+def controller(qapp, backend, tmp_path):
+    from fakes import app, flush_deletes
+    win = app.VolumeController(settings_path=str(tmp_path / "settings.json"))
+    win.poll_timer.stop()
+    win.meter_timer.stop()
+    yield win
+    win.deleteLater()
+    flush_deletes()
@@ -0,0 +1,141 @@
+import importlib.util
+import os
+import sys
+import types
+import weakref
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import pycaw.pycaw  # noqa: F401
+except Exception:
+    # pycaw only imports on Windows. The tests replace GetAllSessions with a
+    # fake backend anyway, so elsewhere they only need the names to exist.
+    pycaw_pkg = types.ModuleType("pycaw")
+    pycaw_mod = types.ModuleType("pycaw.pycaw")
+
+    class AudioUtilities:
+        @staticmethod
+        def GetAllSessions():
+            return []
+
+    class ISimpleAudioVolume:
+        pass
+
+    class IAudioMeterInformation:
+        pass
+
+    pycaw_mod.AudioUtilities = AudioUtilities
+    pycaw_mod.ISimpleAudioVolume = ISimpleAudioVolume
+    pycaw_mod.IAudioMeterInformation = IAudioMeterInformation
+    pycaw_pkg.pycaw = pycaw_mod
+    sys.modules["pycaw"] = pycaw_pkg
+    sys.modules["pycaw.pycaw"] = pycaw_mod
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("priority_volume_app", os.path.join(ROOT, "Priority Volume App.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+app = load_app()
+
+
+class FakeVolume:
+    def __init__(self, volume=1.0, muted=False):
+        self.volume = volume
+        self.muted = muted
+        self.calls = []
+
+    def GetMasterVolume(self):
+        return self.volume
+
+    def SetMasterVolume(self, value, ctx):
+        self.calls.append(("SetMasterVolume", value))
+        self.volume = value
+
+    def GetMute(self):
+        return self.muted
+
+    def SetMute(self, value, ctx):
+        self.calls.append(("SetMute", value))
+        self.muted = value
+
+
+class FakeMeter:
+    def __init__(self, volume):
+        self.volume = volume
+        self.source = 0.0
+
+    def GetPeakValue(self):
+        # Session meters report after the session volume is applied.
+        return self.source * self.volume.volume
+
+
+class FakeProcess:
+    def __init__(self, pid, name):
+        self.pid = pid
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def exe(self):
+        return None
+
+
+class FakeStream:
+    def __init__(self, pid, name, instance, volume=1.0, muted=False):
+        self.process = FakeProcess(pid, name)
+        self.instance = instance
+        self.volume = FakeVolume(volume, muted)
+        self.meter = FakeMeter(self.volume)
+
+
+class FakeControl:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def QueryInterface(self, iface):
+        if iface is app.ISimpleAudioVolume:
+            return self.stream.volume
+        if iface is app.IAudioMeterInformation:
+            return self.stream.meter
+        raise OSError("unsupported interface")
+
+
+class FakeSession:
+    def __init__(self, stream):
+        self._ctl = FakeControl(stream)
+        self.Process = stream.process
+        self.InstanceIdentifier = stream.instance
+
+
+class FakeBackend:
+    def __init__(self):
+        self.streams = []
+        self.volumes = weakref.WeakSet()
+        self.next_instance = 0
+
+    def add(self, pid, name, volume=1.0, muted=False):
+        self.next_instance += 1
+        stream = FakeStream(pid, name, f"{name}|{pid}|{self.next_instance}", volume, muted)
+        self.streams.append(stream)
+        self.volumes.add(stream.volume)
+        return stream
+
+    def remove(self, stream):
+        self.streams.remove(stream)
+
+    def GetAllSessions(self):
+        # Like pycaw, every call hands out fresh session wrappers.
+        return [FakeSession(stream) for stream in self.streams]
+
+
+def flush_deletes():
+    from PyQt5.QtCore import QCoreApplication, QEvent
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
@@ -0,0 +1,165 @@
+import math
+import random
+
+import pytest
+
+from fakes import app
+
+LoudnessTracker = app.LoudnessTracker
+
+
+def feed(tracker, pid, peak, vol, count):
+    for _ in range(count):
+        tracker.update([(pid, peak, vol)])
+
+
+def test_session_volume_is_divided_back_out():
+    tracker = LoudnessTracker()
+    feed(tracker, 1, 0.25, 0.5, app.LEVEL_MIN_SAMPLES)
+    assert tracker.level(1) == pytest.approx(0.5)
+
+
+def test_rolling_level_is_rms_of_source_peaks():
+    tracker = LoudnessTracker()
+    for i in range(2000):
+        tracker.update([(1, 0.2 if i % 2 else 0.4, 1.0)])
+    assert tracker.level(1) == pytest.approx(math.sqrt((0.2 ** 2 + 0.4 ** 2) / 2), rel=0.02)
+    assert len(tracker.stats[1]) == 2
+
+
+def test_silence_and_low_volume_samples_are_skipped():
+    tracker = LoudnessTracker()
+    feed(tracker, 1, 0.0, 1.0, 50)
+    feed(tracker, 1, 0.001, app.LEVEL_MIN_VOLUME / 2, 50)
+    assert 1 not in tracker.stats
+    assert tracker.level(1) is None
+
+
+def test_level_needs_min_samples():
+    tracker = LoudnessTracker()
+    feed(tracker, 1, 0.3, 1.0, app.LEVEL_MIN_SAMPLES - 1)
+    assert tracker.level(1) is None
+    feed(tracker, 1, 0.3, 1.0, 1)
+    assert tracker.level(1) == pytest.approx(0.3)
+
+
+def test_batch_update_and_remove():
+    tracker = LoudnessTracker()
+    for _ in range(app.LEVEL_MIN_SAMPLES):
+        tracker.update([(1, 0.8, 1.0), (2, 0.05, 0.5)])
+    assert tracker.level(1) == pytest.approx(0.8)
+    assert tracker.level(2) == pytest.approx(0.1)
+    tracker.remove(1)
+    assert tracker.level(1) is None
+    assert tracker.level(2) is not None
+
+
+@pytest.fixture
+def leveling(controller, backend):
+    rng = random.Random(7)
+    focus = backend.add(100, "game.exe", volume=1.0)
+    loud = backend.add(101, "music.exe", volume=1.0)
+    quiet = backend.add(102, "podcast.exe", volume=1.0)
+    controller.refresh_sessions()
+    controller.spin_other.setValue(40)
+    controller.spin_level.setValue(20)
+    controller.btn_auto_level.setChecked(True)
+    controller.set_priority_by_pid(100)
+
+    def tick(seconds=1):
+        for _ in range(seconds):
+            for _ in range(10):
+                loud.meter.source = rng.uniform(0.7, 0.9)
+                quiet.meter.source = rng.uniform(0.08, 0.12)
+                focus.meter.source = rng.uniform(0.3, 0.5)
+                controller.update_meters()
+            controller.auto_level()
+
+    return tick, loud, quiet
+
+
+def test_auto_level_converges_with_step_limit(controller, leveling):
+    tick, loud, quiet = leveling
+    history = [loud.volume.volume]
+    for _ in range(60):
+        tick()
+        history.append(loud.volume.volume)
+
+    steps = [abs(b - a) for a, b in zip(history, history[1:])]
+    assert max(steps) <= app.LEVEL_MAX_STEP + 1e-9
+    level = controller.loudness.level(101)
+    assert loud.volume.volume == pytest.approx(0.4 * 0.2 / level, abs=0.011)
+    assert quiet.volume.volume == pytest.approx(0.4)
+    assert controller.rows[100].slider.value() == 100
+
+
+def test_manual_override_is_respected(controller, leveling):
+    tick, loud, quiet = leveling
+    controller.rows[101].slider.setValue(35)
+    tick(30)
+    assert loud.volume.volume == pytest.approx(0.35)
+
+
+def test_all_0_and_all_100_are_not_undone(controller, leveling):
+    tick, loud, quiet = leveling
+    tick(5)
+
+    controller.set_all_0()
+    tick(10)
+    assert loud.volume.volume == 0.0
+    assert quiet.volume.volume == 0.0
+
+    controller.set_all_100()
+    tick(10)
+    assert loud.volume.volume == 1.0
+    assert quiet.volume.volume == 1.0
+
+
+def test_priority_app_closing_leaves_volumes_alone(controller, backend, leveling):
+    tick, loud, quiet = leveling
+    tick(30)
+    loud_before = loud.volume.volume
+
+    backend.remove(backend.streams[0])
+    controller.refresh_sessions()
+    assert controller.priority_pid is None
+    tick(30)
+
+    assert loud.volume.volume == pytest.approx(loud_before)
+    assert quiet.volume.volume == pytest.approx(0.4)
+
+
+def test_external_volume_change_is_a_manual_override(controller, leveling):
+    tick, loud, quiet = leveling
+    tick(10)
+    loud.volume.volume = 0.33
+    controller.refresh_sessions()
+    tick(20)
+
+    assert loud.volume.volume == pytest.approx(0.33)
+    assert controller.rows[101].manual_volume
+
+
+def test_priority_change_applies_levelled_volume_directly(controller, leveling):
+    tick, loud, quiet = leveling
+    tick(60)
+    levelled = loud.volume.volume
+
+    controller.set_priority_by_pid(102)
+    assert loud.volume.volume == pytest.approx(levelled, abs=0.011)
+
+    controller.spin_other.setValue(40)
+    controller.set_priority_by_pid(100)
+    assert loud.volume.volume < 0.4 / 2
+
+
+def test_enabling_auto_level_clears_active_scene(controller, backend):
+    controller.btn_auto_level.setChecked(False)
+    controller.settings["scenes"] = {"s": {"game.exe": [{"volume": 20, "muted": False, "priority": False}]}}
+    backend.add(100, "game.exe")
+    controller.refresh_sessions()
+    controller.apply_scene("s")
+
+    controller.btn_auto_level.setChecked(True)
+
+    assert controller.active_scene is None
@@ -0,0 +1,122 @@
+import gc
+import random
+import tracemalloc
+
+from PyQt5.QtGui import QColor, QPixmap
+
+from fakes import app, flush_deletes
+
+
+def pixmap(size=64):
+    pix = QPixmap(size, size)
+    pix.fill(QColor(10, 20, 30))
+    return pix
+
+
+def assert_counts_match(controller, backend):
+    counts = controller.live_object_counts()
+    pids = {stream.process.pid for stream in backend.streams}
+    assert counts["sessions"] == len(pids)
+    assert counts["rows"] == len(pids)
+    assert counts["row_widgets"] == len(pids)
+    assert counts["icons"] <= app.ICON_CACHE_LIMIT
+    assert len(backend.volumes) == len(backend.streams)
+    return counts
+
+
+def test_removed_session_releases_interfaces_and_row(controller, backend):
+    stream = backend.add(100, "game.exe")
+    controller.refresh_sessions()
+    row = controller.rows[100]
+    assert controller.live_object_counts()["row_widgets"] == 1
+
+    backend.remove(stream)
+    del stream
+    controller.refresh_sessions()
+    flush_deletes()
+
+    assert len(backend.volumes) == 0
+    assert row.vol_iface is None and row.controller is None
+    assert controller.live_object_counts() == {"sessions": 0, "rows": 0, "row_widgets": 0, "icons": 0}
+
+
+def test_new_stream_under_same_pid_replaces_interfaces(controller, backend):
+    old = backend.add(100, "chrome.exe", volume=0.4)
+    controller.refresh_sessions()
+    row = controller.rows[100]
+
+    backend.remove(old)
+    new = backend.add(100, "chrome.exe", volume=0.9)
+    del old
+    controller.refresh_sessions()
+
+    assert len(backend.volumes) == 1
+    assert controller.rows[100] is row
+    assert controller.sessions[100]["vol"] is new.volume
+    assert row.vol_iface is new.volume
+    assert row.slider.value() == 90
+    row.slider.setValue(30)
+    assert new.volume.volume == 0.3
+
+
+def test_icon_cache_is_bounded_and_row_sized(controller):
+    for i in range(app.ICON_CACHE_LIMIT * 3):
+        controller.cache_icon(f"C:\\apps\\app{i}.exe", pixmap(256))
+
+    assert len(controller.icons_cache) == app.ICON_CACHE_LIMIT
+    assert "C:\\apps\\app0.exe" not in controller.icons_cache
+    for pix in controller.icons_cache.values():
+        assert pix.width() <= app.ICON_SIZE and pix.height() <= app.ICON_SIZE
+
+
+def test_soak_24_hours_of_session_churn(controller, backend, monkeypatch):
+    # One refresh per simulated minute; sessions come and go, processes reopen
+    # their streams, and every exe brings its own icon.
+    monkeypatch.setattr(controller, "get_icon_for_pid", lambda pid, proc: controller.cache_icon(proc.name(), pixmap()))
+    rng = random.Random(1234)
+    next_pid = 1000
+    for _ in range(8):
+        backend.add(next_pid, f"app{next_pid}.exe", volume=rng.random())
+        next_pid += 1
+
+    def churn():
+        nonlocal next_pid
+        for _ in range(rng.randint(0, 3)):
+            if len(backend.streams) > 4:
+                backend.remove(rng.choice(backend.streams))
+        for _ in range(rng.randint(0, 3)):
+            if len(backend.streams) < 12:
+                backend.add(next_pid, f"app{next_pid}.exe", volume=rng.random())
+                next_pid += 1
+        if rng.random() < 0.3:
+            old = rng.choice(backend.streams)
+            backend.remove(old)
+            backend.add(old.process.pid, old.process.name(), volume=rng.random())
+        for stream in backend.streams:
+            stream.meter.source = rng.random()
+
+    def minute():
+        churn()
+        controller.refresh_sessions()
+        for _ in range(5):
+            controller.update_meters()
+        flush_deletes()
+
+    # Trace from the start so objects that merely replace older ones are not
+    # counted as growth, then compare the memory in use hour by hour.
+    tracemalloc.start()
+    try:
+        hourly = []
+        for _ in range(24):
+            for _ in range(60):
+                minute()
+            gc.collect()
+            counts = assert_counts_match(controller, backend)
+            assert counts["icons"] == app.ICON_CACHE_LIMIT
+            hourly.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+
+    assert next_pid - 1000 > app.ICON_CACHE_LIMIT * 10
+    # The first hours fill the icon cache and warm up allocator pools.
+    assert max(hourly[12:]) - max(hourly[2:12]) < 32 * 1024
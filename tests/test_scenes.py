@@ -0,0 +1,102 @@
+import time
+
+
+def writes(stream):
+    return list(stream.volume.calls)
+
+
+def test_capture_keeps_each_session_of_an_exe(controller, backend):
+    backend.add(100, "chrome.exe", volume=0.3)
+    backend.add(101, "chrome.exe", volume=0.8, muted=True)
+    controller.refresh_sessions()
+
+    scene = controller.capture_scene()
+
+    assert scene["chrome.exe"] == [
+        {"volume": 30, "muted": False, "priority": False},
+        {"volume": 80, "muted": True, "priority": False},
+    ]
+
+
+def test_apply_only_writes_sessions_that_differ(controller, backend):
+    same = backend.add(100, "game.exe", volume=0.5)
+    louder = backend.add(101, "music.exe", volume=0.2)
+    muted = backend.add(102, "chat.exe", volume=0.4)
+    controller.refresh_sessions()
+    controller.settings["scenes"] = {"gaming": {
+        "game.exe": [{"volume": 50, "muted": False, "priority": True}],
+        "music.exe": [{"volume": 70, "muted": False, "priority": False}],
+        "chat.exe": [{"volume": 40, "muted": True, "priority": False}],
+    }}
+
+    controller.apply_scene("gaming")
+
+    assert writes(same) == []
+    assert writes(louder) == [("SetMasterVolume", 0.7)]
+    assert writes(muted) == [("SetMute", True)]
+    assert controller.priority_pid == 100
+    assert controller.rows[101].slider.value() == 70
+    assert controller.rows[102].mute_button.isChecked()
+
+
+def test_apply_diffs_against_live_volume_not_stale_row(controller, backend):
+    stream = backend.add(100, "game.exe", volume=0.5)
+    controller.refresh_sessions()
+    controller.settings["scenes"] = {"s": {"game.exe": [{"volume": 50, "muted": False, "priority": False}]}}
+    stream.volume.volume = 0.9
+
+    controller.apply_scene("s")
+
+    assert writes(stream) == [("SetMasterVolume", 0.5)]
+
+
+def test_sessions_appearing_later_get_their_entry(controller, backend):
+    backend.add(100, "game.exe", volume=1.0)
+    controller.refresh_sessions()
+    controller.settings["scenes"] = {"focus": {
+        "game.exe": [{"volume": 20, "muted": False, "priority": False}],
+        "chrome.exe": [
+            {"volume": 60, "muted": False, "priority": True},
+            {"volume": 10, "muted": True, "priority": False},
+        ],
+    }}
+    controller.apply_scene("focus")
+
+    first = backend.add(200, "chrome.exe", volume=1.0)
+    second = backend.add(201, "chrome.exe", volume=1.0)
+    controller.refresh_sessions()
+
+    assert writes(first) == [("SetMasterVolume", 0.6)]
+    assert writes(second) == [("SetMasterVolume", 0.1), ("SetMute", True)]
+    assert controller.priority_pid == 200
+
+
+def test_spin_change_clears_active_scene(controller, backend):
+    backend.add(100, "game.exe")
+    controller.refresh_sessions()
+    controller.settings["scenes"] = {"s": {"game.exe": [{"volume": 20, "muted": False, "priority": False}]}}
+    controller.apply_scene("s")
+
+    controller.spin_other.setValue(35)
+
+    assert controller.active_scene is None
+
+
+def test_apply_scene_timing_with_many_sessions(controller, backend):
+    streams = [backend.add(1000 + i, f"app{i}.exe", volume=0.5) for i in range(150)]
+    controller.refresh_sessions()
+    scene = {}
+    for i in range(150):
+        scene[f"app{i}.exe"] = [{"volume": 50 if i % 3 else 25, "muted": i % 5 == 0, "priority": False}]
+    controller.settings["scenes"] = {"big": scene}
+
+    start = time.perf_counter()
+    controller.apply_scene("big")
+    elapsed = time.perf_counter() - start
+
+    changed = [s for s in streams if s.volume.calls]
+    expected = [s for i, s in enumerate(streams) if i % 3 == 0 or i % 5 == 0]
+    assert changed == expected
+    for i, s in enumerate(streams):
+        assert len(s.volume.calls) == (i % 3 == 0) + (i % 5 == 0)
+    assert elapsed < 0.5
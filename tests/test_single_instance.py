@@ -0,0 +1,100 @@
+import errno
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import single_instance
+from single_instance import INSTANCE_NAME, InstanceLock, answer_instance_request, instance_user, notify_running_instance
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Priority Volume App.py")
+
+
+def lock_path(tmp_path):
+    return str(tmp_path / f"{INSTANCE_NAME}-{instance_user()}.lock")
+
+
+def serve(srv, handled, count=1):
+    srv.setblocking(True)
+    srv.settimeout(5)
+    for _ in range(count):
+        try:
+            conn, _ = srv.accept()
+        except OSError:
+            return
+        handled.append(answer_instance_request(conn, timeout=1.0))
+
+
+def test_lock_is_exclusive(tmp_path):
+    first = InstanceLock(lock_path(tmp_path))
+    assert first.acquire()
+    assert first.server is not None
+    assert not InstanceLock(lock_path(tmp_path)).acquire()
+
+
+def test_unusable_lock_path_starts_unprotected(tmp_path):
+    path = tmp_path / f"{INSTANCE_NAME}-{instance_user()}.lock"
+    path.mkdir()
+    lock = InstanceLock(str(path))
+    assert lock.acquire()
+    assert lock.server is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="flock is only used off Windows")
+def test_lock_errors_other_than_contention_start_unprotected(tmp_path, monkeypatch):
+    def fail(fd, op):
+        raise OSError(errno.ENOLCK, "no locks available")
+
+    monkeypatch.setattr(single_instance.fcntl, "flock", fail)
+    lock = InstanceLock(lock_path(tmp_path))
+    assert lock.acquire()
+    assert lock.server is None
+
+
+def test_second_launch_hands_off_and_exits_fast(tmp_path):
+    lock = InstanceLock(lock_path(tmp_path))
+    assert lock.acquire()
+    handled = []
+    t = threading.Thread(target=serve, args=(lock.server, handled))
+    t.start()
+
+    env = dict(os.environ, TMPDIR=str(tmp_path), TEMP=str(tmp_path), TMP=str(tmp_path))
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, SCRIPT], env=env, capture_output=True, timeout=10)
+    elapsed = time.perf_counter() - start
+    t.join()
+
+    assert proc.returncode == 0, proc.stderr
+    assert handled == [True]
+    # Interpreter startup dominates; the hand-off itself is a loopback round trip.
+    assert elapsed < 1.0
+
+
+def test_foreign_listener_is_not_taken_for_the_app(tmp_path):
+    lock = InstanceLock(lock_path(tmp_path))
+    assert lock.acquire()
+    foreign = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    foreign.bind(("127.0.0.1", 0))
+    foreign.listen(4)
+    with open(lock.path, "w", encoding="utf-8") as f:
+        f.write(str(foreign.getsockname()[1]))
+
+    def answer_wrong():
+        foreign.settimeout(5)
+        while True:
+            try:
+                conn, _ = foreign.accept()
+            except OSError:
+                return
+            conn.sendall(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+            conn.close()
+
+    threading.Thread(target=answer_wrong, daemon=True).start()
+    try:
+        assert not notify_running_instance(lock.path, wait=0.3)
+    finally:
+        foreign.close()